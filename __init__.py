@@ -7,34 +7,90 @@
     client = FastNoteClient("http://localhost:9000")
     client.login("admin", "password123")
     notes = client.list_notes("my-vault")
+
+子模块按需加载（PEP 562）：仅导入异常类或模型时不会触发 ``import requests``。
 """
 
-from .client import FastNoteClient
-from .exceptions import (
-    AuthenticationError,
-    FastNoteAPIError,
-    NotFoundError,
-    PermissionError_,
-    RegistrationClosedError,
-    UserExistsError,
-    UserNotFoundError,
-    ValidationError,
-)
-from .models import (
-    AdminConfig,
-    DiffItem,
-    HistoryDetail,
-    HistoryListItem,
-    NoteDetail,
-    NoteInfo,
-    NoteListItem,
-    Pager,
-    PaginatedResponse,
-    UserInfo,
-    VaultInfo,
-    VersionInfo,
-    WebGUIConfig,
-)
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .async_client import AsyncFastNoteClient
+    from .client import FastNoteClient
+    from .exceptions import (
+        AuthenticationError,
+        FastNoteAPIError,
+        NotFoundError,
+        PermissionError_,
+        RegistrationClosedError,
+        UserExistsError,
+        UserNotFoundError,
+        ValidationError,
+    )
+    from .models import (
+        AdminConfig,
+        DiffItem,
+        HistoryDetail,
+        HistoryListItem,
+        NoteDetail,
+        NoteInfo,
+        NoteListItem,
+        Pager,
+        PaginatedResponse,
+        UserInfo,
+        VaultInfo,
+        VersionInfo,
+        WebGUIConfig,
+        set_keep_raw,
+    )
+
+# 公共名称 -> 所在子模块
+_LAZY: dict[str, str] = {
+    # Client
+    "FastNoteClient": ".client",
+    # 依赖可选的 httpx，不列入 __all__，避免 import * 时强制加载
+    "AsyncFastNoteClient": ".async_client",
+    # Exceptions
+    "FastNoteAPIError": ".exceptions",
+    "AuthenticationError": ".exceptions",
+    "NotFoundError": ".exceptions",
+    "ValidationError": ".exceptions",
+    "PermissionError_": ".exceptions",
+    "RegistrationClosedError": ".exceptions",
+    "UserExistsError": ".exceptions",
+    "UserNotFoundError": ".exceptions",
+    # Models
+    "AdminConfig": ".models",
+    "DiffItem": ".models",
+    "HistoryDetail": ".models",
+    "HistoryListItem": ".models",
+    "NoteDetail": ".models",
+    "NoteInfo": ".models",
+    "NoteListItem": ".models",
+    "Pager": ".models",
+    "PaginatedResponse": ".models",
+    "UserInfo": ".models",
+    "VaultInfo": ".models",
+    "VersionInfo": ".models",
+    "WebGUIConfig": ".models",
+    "set_keep_raw": ".models",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY:
+        module = importlib.import_module(_LAZY[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
+
 
 __all__ = [
     # Client
@@ -62,4 +118,10 @@ __all__ = [
     "VaultInfo",
     "VersionInfo",
     "WebGUIConfig",
+    # Options
+    "set_keep_raw",
 ]
+
+if TYPE_CHECKING:
+    # 仅对类型检查器导出；运行时不列入 __all__，避免 import * 时强制加载 httpx
+    __all__ += ["AsyncFastNoteClient"]
@@ -0,0 +1,84 @@
+"""Fast Note Sync Service — 内部缓存工具"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from typing import Any, Callable, Hashable, Iterator
+
+
+class LRUCache(MutableMapping):
+    """线程安全的 LRU 缓存，条目数超过 maxsize 或总大小超过 maxbytes 时淘汰最久未使用的条目。
+
+    Args:
+        maxsize: 最多保留的条目数
+        maxbytes: 所有条目的总大小上限（字节），None 表示不限
+        maxitembytes: 单个条目的大小上限（字节），超过时不写入，None 表示不限
+        weigh: 计算单个值大小的函数，配合 maxbytes / maxitembytes 使用
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 32,
+        maxbytes: int | None = None,
+        maxitembytes: int | None = None,
+        weigh: Callable[[Any], int] = len,
+    ):
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.maxitembytes = maxitembytes
+        self.weigh = weigh
+        self.currbytes = 0
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+        self._sizes: dict[Hashable, int] = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, key: Hashable) -> Any:
+        with self._lock:
+            value = self._data[key]
+            self._data.move_to_end(key)
+            return value
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        sized = self.maxbytes is not None or self.maxitembytes is not None
+        size = self.weigh(value) if sized else 0
+        with self._lock:
+            if key in self._data:
+                self._discard(key)
+            if self.maxitembytes is not None and size > self.maxitembytes:
+                return
+            self._data[key] = value
+            self._sizes[key] = size
+            self.currbytes += size
+            while len(self._data) > self.maxsize or (
+                self.maxbytes is not None and self.currbytes > self.maxbytes
+            ):
+                self._discard(next(iter(self._data)))
+
+    def __delitem__(self, key: Hashable) -> None:
+        with self._lock:
+            self._discard(key)
+
+    def _discard(self, key: Hashable) -> None:
+        del self._data[key]
+        self.currbytes -= self._sizes.pop(key)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        with self._lock:
+            return iter(list(self._data))
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return (
+            f"LRUCache(maxsize={self.maxsize}, maxbytes={self.maxbytes}, "
+            f"len={len(self)}, currbytes={self.currbytes})"
+        )
@@ -0,0 +1,70 @@
+"""Fast Note Sync Service — msgspec 快速解码（可选）
+
+客户端以 page_raw=False 创建且安装了 msgspec 时，笔记列表直接从响应字节解码为
+Struct，跳过“JSON → dict → dataclass”中每行一个的中间 dict；此时不保留原始数据，
+PaginatedResponse.raw 为空 dict。未安装时 ENABLED 为 False，客户端走常规 dict 解析。
+"""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+
+from .exceptions import raise_for_api_error
+from .models import NoteListItem, Pager, PaginatedResponse
+
+try:
+    import msgspec
+except ImportError:  # msgspec 为可选依赖
+    msgspec = None
+
+ENABLED = msgspec is not None
+
+# Struct 与服务端数据不符（如字段类型变化）时抛出，调用方应回退到 dict 解析
+DecodeError: Any = msgspec.DecodeError if msgspec is not None else ()
+
+
+if msgspec is not None:
+
+    class _NoteRow(msgspec.Struct, rename="camel"):
+        id: int = 0
+        action: str = ""
+        path: str = ""
+        path_hash: str = ""
+        version: int = 0
+        ctime: int = 0
+        mtime: int = 0
+        updated_timestamp: int = 0
+        updated_at: str = ""
+        created_at: str = ""
+
+    class _NotesData(msgspec.Struct):
+        rows: Optional[list[_NoteRow]] = msgspec.field(default=None, name="list")
+        pager: dict[str, Any] = {}
+
+    class _NotesEnvelope(msgspec.Struct):
+        status: bool = False
+        code: int = 0
+        message: str = "Unknown error"
+        details: Any = None
+        data: Optional[_NotesData] = None
+
+    _NOTES_DEC = msgspec.json.Decoder(_NotesEnvelope)
+
+
+def decode_notes(content: bytes) -> PaginatedResponse[NoteListItem]:
+    """将 GET /api/notes 的响应字节解码为分页结果（raw 为空 dict）。"""
+    env = _NOTES_DEC.decode(content)
+    if not env.status:
+        raise_for_api_error(env.code, env.message, env.details)
+    data = env.data or _NotesData()
+    item = NoteListItem
+    rows = [
+        item(
+            r.id, r.action, r.path, r.path_hash, r.version,
+            r.ctime, r.mtime, r.updated_timestamp, r.updated_at, r.created_at,
+            {},
+        )
+        for r in data.rows or ()
+    ]
+    return PaginatedResponse(rows, Pager.from_dict(data.pager), {})
+
@@ -0,0 +1,575 @@
+"""Fast Note Sync Service — 异步 Python Client
+
+基于 httpx.AsyncClient（HTTP/2 + keep-alive 连接池），各接口方法与 FastNoteClient 同名同参；
+分页遍历改用 iter_all_notes_concurrent，get_note_file 不做 ETag 缓存。
+需要额外安装 ``pip install "httpx[http2]"``。
+
+用法::
+
+    from pyclient.async_client import AsyncFastNoteClient
+
+    client = AsyncFastNoteClient("http://localhost:9000")
+    await client.login("admin", "password123")
+    async for note in client.iter_all_notes_concurrent("my-vault"):
+        print(note.path)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import os
+from typing import IO, Any, AsyncGenerator, Callable
+
+import httpx
+
+from . import _structs
+from .client import (
+    T,
+    _BOOL_STR,
+    _error_envelope,
+    _loads,
+    _notes_page,
+    _notes_params,
+    _unwrap,
+)
+from .models import (
+    AdminConfig,
+    HistoryDetail,
+    HistoryListItem,
+    NoteDetail,
+    NoteInfo,
+    NoteListItem,
+    Pager,
+    PaginatedResponse,
+    UserInfo,
+    VaultInfo,
+    VersionInfo,
+    WebGUIConfig,
+)
+
+
+class AsyncFastNoteClient:
+    """Fast Note Sync Service REST API 异步客户端。
+
+    用法::
+
+        client = AsyncFastNoteClient("http://localhost:9000")
+        await client.login("admin", "password123")
+        notes = await client.list_notes("my-vault")
+
+    推荐以异步上下文管理器使用，退出时自动释放连接::
+
+        async with AsyncFastNoteClient("http://localhost:9000") as client:
+            await client.login("admin", "password123")
+    """
+
+    def __init__(
+        self,
+        base_url: str = "http://localhost:9000",
+        timeout: int = 30,
+        *,
+        max_keepalive_connections: int = 32,
+        max_connections: int = 64,
+        http2: bool = True,
+        page_raw: bool = True,
+    ):
+        """
+        Args:
+            base_url: 服务地址
+            timeout: 请求超时（秒）
+            max_keepalive_connections: 保持 keep-alive 的空闲连接数上限
+            max_connections: 并发连接数上限
+            http2: 是否启用 HTTP/2（需要安装 h2）
+            page_raw: 同 FastNoteClient 的 page_raw
+        """
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.page_raw = page_raw
+        self._token: str | None = None
+        self.client = httpx.AsyncClient(
+            base_url=f"{self.base_url}/api",
+            http2=http2,
+            limits=httpx.Limits(
+                max_keepalive_connections=max_keepalive_connections,
+                max_connections=max_connections,
+            ),
+            timeout=timeout,
+        )
+
+    # ------------------------------------------------------------------
+    # 连接管理
+    # ------------------------------------------------------------------
+
+    async def aclose(self) -> None:
+        """关闭底层 httpx.AsyncClient 并释放连接。"""
+        await self.client.aclose()
+
+    async def __aenter__(self) -> AsyncFastNoteClient:
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        await self.aclose()
+
+    # ------------------------------------------------------------------
+    # Token 管理
+    # ------------------------------------------------------------------
+
+    def set_token(self, token: str | None) -> None:
+        """外部注入 token，无需调用 login()。
+
+        自动添加 Bearer 前缀（如果未包含）；传入 None 或空串则清除认证头。
+        """
+        if not token:
+            self.client.headers.pop("Authorization", None)
+            self._token = None
+            return
+        if not token.startswith(("Bearer ", "bearer ")):
+            token = "Bearer " + token
+        self.client.headers["Authorization"] = token
+        self._token = token
+
+    @property
+    def token(self) -> str | None:
+        """当前使用的 token（含 Bearer 前缀）。"""
+        return self._token
+
+    # ------------------------------------------------------------------
+    # 内部请求方法
+    # ------------------------------------------------------------------
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        *,
+        params: dict[str, Any] | None = None,
+        form: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+    ) -> httpx.Response:
+        """发送请求并检查 HTTP 状态，错误处理同 FastNoteClient._send。"""
+        resp = await self.client.request(
+            method,
+            endpoint,
+            params=params,
+            data=form,
+            json=json,
+        )
+        if resp.status_code >= 400:
+            body = _error_envelope(resp)
+            if body is not None:
+                _unwrap(body)
+            resp.raise_for_status()
+        return resp
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        *,
+        params: dict[str, Any] | None = None,
+        form: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """统一发送请求并解析响应，参数与返回值同 FastNoteClient._request。
+
+        Raises:
+            FastNoteAPIError 或其子类
+            httpx.HTTPStatusError: HTTP 层面错误
+        """
+        resp = await self._send(method, endpoint, params=params, form=form, json=json)
+        return _unwrap(_loads(resp.content))
+
+    async def _request_decoded(
+        self,
+        method: str,
+        endpoint: str,
+        fast: Callable[[bytes], T],
+        slow: Callable[[Any], T],
+        *,
+        params: dict[str, Any] | None = None,
+    ) -> T:
+        """同 FastNoteClient._request_decoded。"""
+        content = (await self._send(method, endpoint, params=params)).content
+        try:
+            return fast(content)
+        except _structs.DecodeError:
+            return slow(_unwrap(_loads(content)))
+
+    async def _request_raw(
+        self,
+        method: str,
+        endpoint: str,
+        *,
+        params: dict[str, Any] | None = None,
+    ) -> httpx.Response:
+        """发送请求并返回原始 Response 对象（用于文件下载等非 JSON 接口）。"""
+        resp = await self.client.request(method, endpoint, params=params)
+        resp.raise_for_status()
+        return resp
+
+    # ==================================================================
+    # 公开接口（无需认证）
+    # ==================================================================
+
+    async def register(
+        self,
+        email: str,
+        username: str,
+        password: str,
+        confirm_password: str,
+    ) -> UserInfo:
+        """POST /api/user/register — 用户注册，成功后自动设置 token。"""
+        data = await self._request("POST", "/user/register", form={
+            "email": email,
+            "username": username,
+            "password": password,
+            "confirmPassword": confirm_password,
+        })
+        user = UserInfo.from_dict(data)
+        if user.token:
+            self.set_token(user.token)
+        return user
+
+    async def login(self, credentials: str, password: str) -> UserInfo:
+        """POST /api/user/login — 用户登录，成功后自动设置 token。"""
+        data = await self._request("POST", "/user/login", form={
+            "credentials": credentials,
+            "password": password,
+        })
+        user = UserInfo.from_dict(data)
+        if user.token:
+            self.set_token(user.token)
+        return user
+
+    async def get_version(self) -> VersionInfo:
+        """GET /api/version — 获取服务端版本信息。"""
+        data = await self._request("GET", "/version")
+        return VersionInfo.from_dict(data)
+
+    async def get_webgui_config(self) -> WebGUIConfig:
+        """GET /api/webgui/config — 获取 WebGUI 配置。"""
+        data = await self._request("GET", "/webgui/config")
+        return WebGUIConfig.from_dict(data)
+
+    # ==================================================================
+    # 需认证接口 — 用户相关
+    # ==================================================================
+
+    async def get_user_info(self) -> UserInfo:
+        """GET /api/user/info — 获取当前登录用户信息。"""
+        data = await self._request("GET", "/user/info")
+        return UserInfo.from_dict(data)
+
+    async def change_password(
+        self,
+        old_password: str,
+        password: str,
+        confirm_password: str,
+    ) -> dict[str, Any]:
+        """POST /api/user/change_password — 修改密码。"""
+        return await self._request("POST", "/user/change_password", form={
+            "oldPassword": old_password,
+            "password": password,
+            "confirmPassword": confirm_password,
+        })
+
+    # ==================================================================
+    # 需认证接口 — Vault CRUD
+    # ==================================================================
+
+    async def list_vaults(self) -> list[VaultInfo]:
+        """GET /api/vault — 获取所有仓库列表。"""
+        data = await self._request("GET", "/vault")
+        if data is None:
+            return []
+        if isinstance(data, list):
+            return [VaultInfo.from_dict(v) for v in data]
+        return [VaultInfo.from_dict(v) for v in data.get("list", data)]
+
+    async def create_vault(self, vault_name: str) -> VaultInfo:
+        """POST /api/vault — 创建仓库。"""
+        data = await self._request("POST", "/vault", json={
+            "vault": vault_name,
+        })
+        return VaultInfo.from_dict(data)
+
+    async def update_vault(self, vault_id: int, vault_name: str) -> VaultInfo:
+        """POST /api/vault — 更新仓库名称。"""
+        data = await self._request("POST", "/vault", json={
+            "id": vault_id,
+            "vault": vault_name,
+        })
+        return VaultInfo.from_dict(data)
+
+    async def delete_vault(self, vault_id: int) -> dict[str, Any]:
+        """DELETE /api/vault — 删除仓库。"""
+        data = await self._request("DELETE", "/vault", params={"id": vault_id})
+        return data or {}
+
+    # ==================================================================
+    # 需认证接口 — Note CRUD
+    # ==================================================================
+
+    async def list_notes(
+        self,
+        vault: str,
+        *,
+        keyword: str | None = None,
+        is_recycle: bool | None = None,
+        page: int = 1,
+        page_size: int = 10,
+    ) -> PaginatedResponse[NoteListItem]:
+        """GET /api/notes — 获取笔记列表（支持 FTS 全文搜索）。"""
+        params = _notes_params(vault, keyword, is_recycle, page, page_size)
+        return await self._fetch_notes(params)
+
+    async def _fetch_notes(self, params: dict[str, Any]) -> PaginatedResponse[NoteListItem]:
+        """用现成的查询参数请求一页 GET /api/notes。"""
+        if not self.page_raw and _structs.ENABLED and not NoteListItem._KEEP_RAW:
+            return await self._request_decoded(
+                "GET",
+                "/notes",
+                _structs.decode_notes,
+                lambda data: _notes_page(data, keep_raw=False),
+                params=params,
+            )
+        data = await self._request("GET", "/notes", params=params)
+        return _notes_page(data, self.page_raw)
+
+    async def get_note(
+        self,
+        vault: str,
+        path: str,
+        *,
+        is_recycle: bool | None = None,
+    ) -> NoteDetail:
+        """GET /api/note — 获取单条笔记（含完整内容）。"""
+        params: dict[str, Any] = {"vault": vault, "path": path}
+        if is_recycle is not None:
+            params["isRecycle"] = _BOOL_STR[is_recycle]
+        data = await self._request("GET", "/note", params=params)
+        return NoteDetail.from_dict(data)
+
+    async def create_note(
+        self,
+        vault: str,
+        path: str,
+        content: str = "",
+        **kwargs: Any,
+    ) -> NoteInfo:
+        """POST /api/note — 创建笔记。"""
+        payload: dict[str, Any] = {
+            "vault": vault,
+            "path": path,
+            "content": content,
+        }
+        payload.update(kwargs)
+        data = await self._request("POST", "/note", json=payload)
+        return NoteInfo.from_dict(data)
+
+    async def update_note(
+        self,
+        vault: str,
+        path: str,
+        content: str,
+        **kwargs: Any,
+    ) -> NoteInfo:
+        """POST /api/note — 更新笔记内容。"""
+        payload: dict[str, Any] = {
+            "vault": vault,
+            "path": path,
+            "content": content,
+        }
+        payload.update(kwargs)
+        data = await self._request("POST", "/note", json=payload)
+        return NoteInfo.from_dict(data)
+
+    async def delete_note(self, vault: str, path: str) -> dict[str, Any]:
+        """DELETE /api/note — 删除笔记。"""
+        data = await self._request("DELETE", "/note", params={
+            "vault": vault,
+            "path": path,
+        })
+        return data or {}
+
+    async def get_note_file(self, vault: str, path: str) -> bytes:
+        """GET /api/note/file — 获取文件原始内容（bytes）。"""
+        resp = await self._request_raw("GET", "/note/file", params={
+            "vault": vault,
+            "path": path,
+        })
+        return resp.content
+
+    async def get_note_file_raw(self, vault: str, path: str) -> bytes:
+        """GET /api/note/file — 直接读取底层连接上的字节，跳过 content-encoding 解码。
+
+        服务端仍返回压缩内容时回退为正常解码，返回值始终是文件本身。
+        """
+        params = {"vault": vault, "path": path}
+        headers = {"Accept-Encoding": "identity"}
+        async with self.client.stream(
+            "GET", "/note/file", params=params, headers=headers
+        ) as resp:
+            resp.raise_for_status()
+            if resp.headers.get("Content-Encoding", "identity") != "identity":
+                return await resp.aread()
+            return b"".join([chunk async for chunk in resp.aiter_raw()])
+
+    async def download_note_file(
+        self,
+        vault: str,
+        path: str,
+        dest: str | os.PathLike[str] | IO[bytes],
+        chunk_size: int = 1 << 16,
+    ) -> int:
+        """GET /api/note/file — 以流式方式将文件写入 dest，返回写入的字节数。"""
+        params = {"vault": vault, "path": path}
+        written = 0
+        async with self.client.stream("GET", "/note/file", params=params) as resp:
+            resp.raise_for_status()
+            if isinstance(dest, (str, os.PathLike)):
+                fp = open(dest, "wb")
+            else:
+                fp = dest
+            try:
+                async for chunk in resp.aiter_bytes(chunk_size):
+                    fp.write(chunk)
+                    written += len(chunk)
+            finally:
+                if fp is not dest:
+                    fp.close()
+        return written
+
+    # ------------------------------------------------------------------
+    # 分页便利方法
+    # ------------------------------------------------------------------
+
+    async def iter_all_notes_concurrent(
+        self,
+        vault: str,
+        *,
+        keyword: str | None = None,
+        is_recycle: bool | None = None,
+        page_size: int = 50,
+        max_workers: int = 8,
+    ) -> AsyncGenerator[NoteListItem, None]:
+        """并发翻页遍历仓库中所有笔记的异步生成器。
+
+        先请求第 1 页获取 total_rows，再并发请求其余页（同时进行中的请求数
+        不超过 max_workers），按页码顺序产出结果，无需等待全部页返回。
+
+        用法::
+
+            async for note in client.iter_all_notes_concurrent("my-vault", max_workers=8):
+                print(note.path)
+        """
+        params = _notes_params(vault, keyword, is_recycle, 1, page_size)
+        first = await self._fetch_notes(params)
+        for item in first.list:
+            yield item
+        # 服务端可能截断 page_size（最大 100），以实际返回值计算页数
+        size = first.pager.page_size or page_size
+        n_pages = math.ceil(first.pager.total_rows / size)
+        if n_pages <= 1:
+            return
+        params["page_size"] = size
+        sem = asyncio.Semaphore(max_workers)
+
+        async def fetch(page: int) -> PaginatedResponse[NoteListItem]:
+            async with sem:
+                return await self._fetch_notes({**params, "page": page})
+
+        tasks = [asyncio.ensure_future(fetch(p)) for p in range(2, n_pages + 1)]
+        try:
+            for task in tasks:
+                for item in (await task).list:
+                    yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    # ==================================================================
+    # 需认证接口 — Note History
+    # ==================================================================
+
+    async def list_note_histories(
+        self,
+        vault: str,
+        path: str,
+        *,
+        is_recycle: bool | None = None,
+        page: int = 1,
+        page_size: int = 10,
+    ) -> PaginatedResponse[HistoryListItem]:
+        """GET /api/note/histories — 获取笔记历史版本列表。"""
+        params: dict[str, Any] = {
+            "vault": vault,
+            "path": path,
+            "page": page,
+            "page_size": page_size,
+        }
+        if is_recycle is not None:
+            params["isRecycle"] = _BOOL_STR[is_recycle]
+        data = await self._request("GET", "/note/histories", params=params)
+        items = [HistoryListItem.from_dict_fast(h) for h in (data.get("list") or [])]
+        pager = Pager.from_dict(data.get("pager", {}))
+        return PaginatedResponse(list=items, pager=pager, raw=data)
+
+    async def get_note_history(self, history_id: int) -> HistoryDetail:
+        """GET /api/note/history — 获取某个历史版本的详细信息。"""
+        params = {"id": history_id}
+        data = await self._request("GET", "/note/history", params=params)
+        return HistoryDetail.from_dict(data)
+
+    async def get_note_histories_bulk(
+        self,
+        history_ids: list[int],
+        *,
+        max_workers: int = 8,
+    ) -> list[HistoryDetail]:
+        """并发获取多个历史版本详情，返回顺序与 history_ids 一致。
+
+        同时进行中的请求数不超过 max_workers。
+        """
+        sem = asyncio.Semaphore(max_workers)
+
+        async def fetch(history_id: int) -> HistoryDetail:
+            async with sem:
+                return await self.get_note_history(history_id)
+
+        return list(await asyncio.gather(*(fetch(h) for h in history_ids)))
+
+    async def restore_note_from_history(
+        self,
+        vault: str,
+        history_id: int,
+    ) -> NoteInfo:
+        """PUT /api/note/history/restore — 将笔记恢复到指定的历史版本。"""
+        data = await self._request("PUT", "/note/history/restore", json={
+            "vault": vault,
+            "historyId": history_id,
+        })
+        return NoteInfo.from_dict(data)
+
+    # ==================================================================
+    # 需认证接口 — Admin
+    # ==================================================================
+
+    async def get_admin_config(self) -> AdminConfig:
+        """GET /api/admin/config — 获取管理配置（需管理员权限）。"""
+        data = await self._request("GET", "/admin/config")
+        return AdminConfig.from_dict(data)
+
+    async def update_admin_config(self, **kwargs: Any) -> AdminConfig:
+        """POST /api/admin/config — 更新管理配置（需管理员权限）。"""
+        data = await self._request("POST", "/admin/config", json=kwargs)
+        return AdminConfig.from_dict(data)
+
+    # ------------------------------------------------------------------
+    # 便利方法
+    # ------------------------------------------------------------------
+
+    def __repr__(self) -> str:
+        authed = "已认证" if self.token else "未认证"
+        return f"<AsyncFastNoteClient base_url={self.base_url!r} {authed}>"
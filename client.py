@@ -6,10 +6,19 @@ Form/JSON 编码按文档严格区分，pathHash/contentHash 由服务端自动
 
 from __future__ import annotations
 
-from typing import Any, Generator
+import math
+import os
+import socket
+import weakref
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import IO, Any, Callable, Generator, Hashable, MutableMapping, TypeVar
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+from . import _structs
+from ._cache import LRUCache
 from .exceptions import raise_for_api_error
 from .models import (
     AdminConfig,
@@ -27,6 +36,125 @@ from .models import (
 )
 
 
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:  # orjson 为可选依赖，缺失时回退到标准库
+    import json as _json
+
+    _loads = _json.loads
+
+
+# 可重试的状态码与 HTTP 方法。POST 非幂等；唯一的 PUT（恢复历史版本）
+# 每次调用都会生成一条新历史，重放会产生重复记录，因此二者都不在重试之列
+_RETRY_STATUS = frozenset([408, 429, 500, 502, 503, 504, 521, 522, 524])
+_RETRY_METHODS = frozenset(["GET", "DELETE", "HEAD", "OPTIONS"])
+
+# 查询参数中布尔值的序列化形式
+_BOOL_STR = {True: "true", False: "false"}
+
+# 默认 ETag 缓存的总大小上限；超过单项上限的文件不缓存，避免大附件常驻内存
+_CACHE_MAX_BYTES = 8 * 1024 * 1024
+_CACHE_MAX_ITEM_BYTES = 1024 * 1024
+
+
+def _cached_size(entry: tuple[str | None, str | None, bytes]) -> int:
+    """ETag 缓存条目 (ETag, Last-Modified, 文件内容) 的大小，按文件内容计。"""
+    return len(entry[2])
+
+
+def _keepalive_socket_options() -> list[tuple[int, int, int]]:
+    """TCP_NODELAY + TCP keepalive 选项；按平台支持情况取舍。
+
+    空闲 60 秒后开始探测，每 30 秒一次，连续 5 次无响应判定断开，
+    避免长时间空闲的连接被中间设备静默丢弃后下次请求才发现。
+    """
+    opts = [
+        (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ]
+    if hasattr(socket, "TCP_KEEPIDLE"):
+        opts.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 60))
+    elif hasattr(socket, "TCP_KEEPALIVE"):  # macOS
+        opts.append((socket.IPPROTO_TCP, socket.TCP_KEEPALIVE, 60))
+    if hasattr(socket, "TCP_KEEPINTVL"):
+        opts.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 30))
+    if hasattr(socket, "TCP_KEEPCNT"):
+        opts.append((socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 5))
+    return opts
+
+
+_SOCKET_OPTIONS = _keepalive_socket_options()
+
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """为连接池中的 socket 开启 TCP keepalive 的 HTTPAdapter。"""
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        kwargs.setdefault("socket_options", _SOCKET_OPTIONS)
+        super().init_poolmanager(*args, **kwargs)
+
+
+T = TypeVar("T")
+
+
+def _unwrap(body: dict[str, Any]) -> Any:
+    """检查响应信封的 status，失败时抛出对应异常，成功时返回 data 字段。"""
+    if not body.get("status"):
+        raise_for_api_error(
+            body.get("code", 0),
+            body.get("message", "Unknown error"),
+            body.get("details"),
+        )
+    return body.get("data")
+
+
+def _error_envelope(resp: Any) -> dict[str, Any] | None:
+    """HTTP 4xx/5xx 响应若带 JSON 错误信封（status=false）则返回之，否则返回 None。
+
+    非 JSON 的错误响应（如网关 502 页面）不做解析。
+    """
+    if "json" not in resp.headers.get("Content-Type", ""):
+        return None
+    try:
+        body = _loads(resp.content)
+    except ValueError:
+        return None
+    if isinstance(body, dict) and "code" in body and not body.get("status"):
+        return body
+    return None
+
+
+def _notes_params(
+    vault: str,
+    keyword: str | None,
+    is_recycle: bool | None,
+    page: int,
+    page_size: int,
+) -> dict[str, Any]:
+    """构造 GET /api/notes 的查询参数。"""
+    params: dict[str, Any] = {
+        "vault": vault,
+        "page": page,
+        "page_size": page_size,
+    }
+    if keyword is not None:
+        params["keyword"] = keyword
+    if is_recycle is not None:
+        params["isRecycle"] = _BOOL_STR[is_recycle]
+    return params
+
+
+def _notes_page(
+    data: dict[str, Any], keep_raw: bool = True
+) -> PaginatedResponse[NoteListItem]:
+    """将 GET /api/notes 的 data 字段解析为分页结果；keep_raw=False 时 raw 为空 dict。"""
+    items = [NoteListItem.from_dict_fast(n) for n in (data.get("list") or [])]
+    pager = Pager.from_dict(data.get("pager", {}))
+    return PaginatedResponse(list=items, pager=pager, raw=data if keep_raw else {})
+
+
 class FastNoteClient:
     """Fast Note Sync Service REST API 客户端。
 
@@ -35,35 +163,182 @@ class FastNoteClient:
         client = FastNoteClient("http://localhost:9000")
         client.login("admin", "password123")
         notes = client.list_notes("my-vault")
+
+    也可作为上下文管理器使用，退出时自动释放连接::
+
+        with FastNoteClient("http://localhost:9000") as client:
+            client.login("admin", "password123")
     """
 
-    def __init__(self, base_url: str = "http://localhost:9000", timeout: int = 30):
+    def __init__(
+        self,
+        base_url: str = "http://localhost:9000",
+        timeout: int = 30,
+        *,
+        pool_size: int = 32,
+        retries: int = 5,
+        backoff_factor: float = 0.25,
+        cache: MutableMapping[Hashable, tuple[str | None, str | None, bytes]] | None = None,
+        transport: str = "requests",
+        page_raw: bool = True,
+    ):
+        """
+        Args:
+            base_url: 服务地址
+            timeout: 请求超时（秒）
+            pool_size: 连接池大小（每个 host 保持的 keep-alive 连接数上限）
+            retries: GET/DELETE 请求遇到连接错误或 5xx 时的最大重试次数；
+                POST/PUT 不重试，以免重复创建笔记或历史版本。DELETE 若在服务端
+                已成功后被重放，可能抛出 NotFoundError (428)
+            backoff_factor: 指数退避基数（秒），第 n 次重试前等待约
+                backoff_factor * 2^(n-1) 秒并叠加随机抖动
+            cache: get_note_file 的 ETag 缓存，值为 (ETag, Last-Modified, 文件内容)；
+                默认使用最多 32 项、总计 8 MiB、单个文件不超过 1 MiB 的线程安全 LRU；
+                自行传入的映射不受这些限制，由其自身决定保留哪些条目
+            transport: 底层 HTTP 实现，"requests"（默认）或 "httpx"。
+                "httpx" 启用 HTTP/2 多路复用，需安装 httpx[http2]；
+                此时 session 为 httpx.Client，重试仅覆盖建立连接失败
+            page_raw: list_notes 是否在 PaginatedResponse.raw 中保留整页原始 data。
+                设为 False 时 raw 为空 dict；若还安装了 msgspec，则直接从响应字节
+                解码，不再为每行构造中间 dict
+        """
+        if transport not in ("requests", "httpx"):
+            raise ValueError(f"transport 只能是 'requests' 或 'httpx'，收到 {transport!r}")
         self.base_url = base_url.rstrip("/")
+        self._api_root = f"{self.base_url}/api"
         self.timeout = timeout
-        self.session = requests.Session()
+        self.pool_size = pool_size
+        self.transport = transport
+        self.page_raw = page_raw
+        self._token: str | None = None
+        if cache is None:
+            cache = LRUCache(
+                32,
+                maxbytes=_CACHE_MAX_BYTES,
+                maxitembytes=_CACHE_MAX_ITEM_BYTES,
+                weigh=_cached_size,
+            )
+        self.cache = cache
+        if transport == "httpx":
+            import httpx
+
+            self.session = httpx.Client(
+                base_url=self._api_root,
+                timeout=timeout,
+                follow_redirects=True,
+                transport=httpx.HTTPTransport(
+                    http2=True,
+                    limits=httpx.Limits(
+                        max_keepalive_connections=pool_size,
+                        max_connections=pool_size * 2,
+                    ),
+                    retries=retries,
+                    socket_options=_SOCKET_OPTIONS,
+                ),
+            )
+        else:
+            self.session = requests.Session()
+            self._mount_adapter(pool_size, retries, backoff_factor)
+        # 忘记 close() 时，在实例被回收或解释器退出前释放连接池
+        self._finalizer = weakref.finalize(self, self.session.close)
+
+    def _mount_adapter(self, pool_size: int, retries: int, backoff_factor: float) -> None:
+        """为 requests.Session 挂载带连接池、重试策略与 TCP keepalive 的 HTTPAdapter。"""
+        # requests 默认连接池仅 10 个连接，并发使用时会频繁丢弃并重建 TLS 连接
+        retry = Retry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            backoff_jitter=0.25,
+            status_forcelist=_RETRY_STATUS,
+            allowed_methods=_RETRY_METHODS,
+            respect_retry_after_header=True,
+            # 重试耗尽后返回最后一次响应，由 raise_for_status() 抛出 HTTPError
+            raise_on_status=False,
+        )
+        adapter = _KeepAliveAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            pool_block=False,
+            max_retries=retry,
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    # ------------------------------------------------------------------
+    # 连接管理
+    # ------------------------------------------------------------------
+
+    def close(self) -> None:
+        """关闭底层 HTTP 会话并释放连接池中的连接，可重复调用。"""
+        self._finalizer()
+
+    def __enter__(self) -> FastNoteClient:
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        self.close()
 
     # ------------------------------------------------------------------
     # Token 管理
     # ------------------------------------------------------------------
 
-    def set_token(self, token: str) -> None:
+    def set_token(self, token: str | None) -> None:
         """外部注入 token，无需调用 login()。
 
-        自动添加 Bearer 前缀（如果未包含）。
+        自动添加 Bearer 前缀（如果未包含）；传入 None 或空串则清除认证头。
         """
-        if token and not token.startswith("Bearer "):
-            token = f"Bearer {token}"
+        if not token:
+            self.session.headers.pop("Authorization", None)
+            self._token = None
+            return
+        if not token.startswith(("Bearer ", "bearer ")):
+            token = "Bearer " + token
         self.session.headers["Authorization"] = token
+        self._token = token
 
     @property
     def token(self) -> str | None:
         """当前使用的 token（含 Bearer 前缀）。"""
-        return self.session.headers.get("Authorization")
+        return self._token
 
     # ------------------------------------------------------------------
     # 内部请求方法
     # ------------------------------------------------------------------
 
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        *,
+        params: dict[str, Any] | None = None,
+        form: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+    ) -> Any:
+        """发送请求并检查 HTTP 状态，返回 requests.Response 或 httpx.Response。
+
+        4xx/5xx 响应带 JSON 错误信封时直接抛出对应的 FastNoteAPIError 子类，
+        否则抛出 HTTP 层面的异常，不解析响应体。
+        """
+        if self.transport == "httpx":
+            resp = self.session.request(
+                method, endpoint, params=params, data=form, json=json
+            )
+        else:
+            resp = self.session.request(
+                method,
+                self._api_root + endpoint,
+                params=params,
+                data=form,
+                json=json,
+                timeout=self.timeout,
+            )
+        if resp.status_code >= 400:
+            body = _error_envelope(resp)
+            if body is not None:
+                _unwrap(body)
+            resp.raise_for_status()
+        return resp
+
     def _request(
         self,
         method: str,
@@ -86,27 +361,27 @@ class FastNoteClient:
             响应中的 data 字段（dict）
 
         Raises:
-            FastNoteAPIError 或其子类
-            requests.HTTPError: HTTP 层面错误
+            FastNoteAPIError 或其子类（包括 HTTP 4xx/5xx 但带 JSON 错误信封的响应）
+            requests.HTTPError / httpx.HTTPStatusError: 其他 HTTP 层面错误
         """
-        url = f"{self.base_url}/api{endpoint}"
-        resp = self.session.request(
-            method,
-            url,
-            params=params,
-            data=form,
-            json=json,
-            timeout=self.timeout,
-        )
-        resp.raise_for_status()
-        body = resp.json()
-        if not body.get("status"):
-            raise_for_api_error(
-                body.get("code", 0),
-                body.get("message", "Unknown error"),
-                body.get("details"),
-            )
-        return body.get("data")
+        resp = self._send(method, endpoint, params=params, form=form, json=json)
+        return _unwrap(_loads(resp.content))
+
+    def _request_decoded(
+        self,
+        method: str,
+        endpoint: str,
+        fast: Callable[[bytes], T],
+        slow: Callable[[Any], T],
+        *,
+        params: dict[str, Any] | None = None,
+    ) -> T:
+        """用 msgspec 直接从响应字节解码（fast），数据与 Struct 不符时回退到 dict 解析（slow）。"""
+        content = self._send(method, endpoint, params=params).content
+        try:
+            return fast(content)
+        except _structs.DecodeError:
+            return slow(_unwrap(_loads(content)))
 
     def _request_raw(
         self,
@@ -114,13 +389,63 @@ class FastNoteClient:
         endpoint: str,
         *,
         params: dict[str, Any] | None = None,
-    ) -> requests.Response:
-        """发送请求并返回原始 Response 对象（用于文件下载等非 JSON 接口）。"""
-        url = f"{self.base_url}/api{endpoint}"
-        resp = self.session.request(
-            method, url, params=params, timeout=self.timeout
-        )
+        stream: bool = False,
+    ) -> Any:
+        """发送请求并返回原始 Response 对象（用于文件下载等非 JSON 接口）。
+
+        返回 requests.Response 或 httpx.Response（取决于 transport）。
+
+        GET 请求会携带缓存的 ETag / Last-Modified 做条件请求，
+        服务端返回 304 时直接复用缓存内容（返回的 Response 状态码为 200）。
+
+        stream=True 时不读取响应体、不走缓存，并要求服务端不压缩
+        （Accept-Encoding: identity），调用方负责读取并关闭 Response。
+        """
+        url = self._api_root + endpoint
+        key = None
+        headers: dict[str, str] = {}
+        cached = None
+        if stream:
+            headers["Accept-Encoding"] = "identity"
+        elif method == "GET":
+            key = (endpoint, tuple(sorted((params or {}).items())))
+            cached = self.cache.get(key)
+            if cached is not None:
+                etag, last_modified, _ = cached
+                if etag:
+                    headers["If-None-Match"] = etag
+                if last_modified:
+                    headers["If-Modified-Since"] = last_modified
+        if self.transport == "httpx":
+            req = self.session.build_request(
+                method, endpoint, params=params, headers=headers
+            )
+            resp = self.session.send(req, stream=stream)
+        else:
+            resp = self.session.request(
+                method,
+                url,
+                params=params,
+                headers=headers,
+                timeout=self.timeout,
+                stream=stream,
+            )
+        if stream:
+            if resp.status_code >= 400:
+                resp.close()
+            resp.raise_for_status()
+            return resp
+        # httpx 的 raise_for_status() 对 304 也会抛错，须先处理
+        if resp.status_code == 304 and cached is not None:
+            resp.status_code = 200
+            resp._content = cached[2]
+            return resp
         resp.raise_for_status()
+        if key is not None:
+            etag = resp.headers.get("ETag")
+            last_modified = resp.headers.get("Last-Modified")
+            if etag or last_modified:
+                self.cache[key] = (etag, last_modified, resp.content)
         return resp
 
     # ==================================================================
@@ -270,19 +595,21 @@ class FastNoteClient:
             page: 页码
             page_size: 每页数量（最大 100）
         """
-        params: dict[str, Any] = {
-            "vault": vault,
-            "page": page,
-            "page_size": page_size,
-        }
-        if keyword is not None:
-            params["keyword"] = keyword
-        if is_recycle is not None:
-            params["isRecycle"] = str(is_recycle).lower()
+        params = _notes_params(vault, keyword, is_recycle, page, page_size)
+        return self._fetch_notes(params)
+
+    def _fetch_notes(self, params: dict[str, Any]) -> PaginatedResponse[NoteListItem]:
+        """用现成的查询参数请求一页 GET /api/notes。"""
+        if not self.page_raw and _structs.ENABLED and not NoteListItem._KEEP_RAW:
+            return self._request_decoded(
+                "GET",
+                "/notes",
+                _structs.decode_notes,
+                lambda data: _notes_page(data, keep_raw=False),
+                params=params,
+            )
         data = self._request("GET", "/notes", params=params)
-        items = [NoteListItem.from_dict(n) for n in (data.get("list") or [])]
-        pager = Pager.from_dict(data.get("pager", {}))
-        return PaginatedResponse(list=items, pager=pager, raw=data)
+        return _notes_page(data, self.page_raw)
 
     # 12. 获取单条笔记
     def get_note(
@@ -295,7 +622,7 @@ class FastNoteClient:
         """GET /api/note — 获取单条笔记（含完整内容）。"""
         params: dict[str, Any] = {"vault": vault, "path": path}
         if is_recycle is not None:
-            params["isRecycle"] = str(is_recycle).lower()
+            params["isRecycle"] = _BOOL_STR[is_recycle]
         data = self._request("GET", "/note", params=params)
         return NoteDetail.from_dict(data)
 
@@ -370,6 +697,75 @@ class FastNoteClient:
         })
         return resp.content
 
+    # 15. 获取附件未经解码的原始字节
+    def get_note_file_raw(self, vault: str, path: str) -> bytes:
+        """GET /api/note/file — 直接读取底层连接上的字节，跳过 content-encoding 解码与分块拼接。
+
+        适合图片、PDF 等本身已压缩的二进制附件。请求时要求服务端不压缩；
+        若服务端仍返回压缩内容，则回退为正常解码，返回值始终是文件本身。
+        """
+        resp = self._request_raw("GET", "/note/file", params={
+            "vault": vault,
+            "path": path,
+        }, stream=True)
+        try:
+            if resp.headers.get("Content-Encoding", "identity") != "identity":
+                return resp.read() if self.transport == "httpx" else resp.content
+            if self.transport == "httpx":
+                return b"".join(resp.iter_raw())
+            return resp.raw.read(decode_content=False)
+        finally:
+            resp.close()
+
+    # 15. 流式下载笔记/附件到文件
+    def download_note_file(
+        self,
+        vault: str,
+        path: str,
+        dest: str | os.PathLike[str] | IO[bytes],
+        chunk_size: int = 1 << 16,
+    ) -> int:
+        """GET /api/note/file — 以流式方式将文件写入 dest，内存占用与文件大小无关。
+
+        适合 PDF、图片等大附件；小文件直接用 get_note_file() 即可。
+
+        Args:
+            vault: 仓库名称
+            path: 文件路径
+            dest: 目标文件路径，或以二进制模式打开的可写文件对象
+            chunk_size: 每次读取的块大小（字节）
+
+        Returns:
+            写入的字节数
+        """
+        url = f"{self._api_root}/note/file"
+        params = {"vault": vault, "path": path}
+        written = 0
+        if self.transport == "httpx":
+            stream = self.session.stream("GET", "/note/file", params=params)
+        else:
+            stream = self.session.get(
+                url, params=params, stream=True, timeout=self.timeout
+            )
+        with stream as resp:
+            resp.raise_for_status()
+            if self.transport == "httpx":
+                chunks = resp.iter_bytes(chunk_size)
+            else:
+                chunks = resp.iter_content(chunk_size)
+            if isinstance(dest, (str, os.PathLike)):
+                fp = open(dest, "wb")
+            else:
+                fp = dest
+            try:
+                for chunk in chunks:
+                    fp.write(chunk)
+                    written += len(chunk)
+            finally:
+                if fp is not dest:
+                    fp.close()
+        return written
+
     # ------------------------------------------------------------------
     # 分页便利方法
     # ------------------------------------------------------------------
@@ -389,20 +785,61 @@ class FastNoteClient:
             for note in client.iter_all_notes("my-vault"):
                 print(note.path)
         """
+        # 查询参数只构造一次，翻页时仅更新 page
+        params = _notes_params(vault, keyword, is_recycle, 1, page_size)
         page = 1
         while True:
-            result = self.list_notes(
-                vault,
-                keyword=keyword,
-                is_recycle=is_recycle,
-                page=page,
-                page_size=page_size,
-            )
+            params["page"] = page
+            result = self._fetch_notes(params)
             yield from result.list
             if page * result.pager.page_size >= result.pager.total_rows:
                 break
             page += 1
 
+    def iter_all_notes_threaded(
+        self,
+        vault: str,
+        *,
+        keyword: str | None = None,
+        is_recycle: bool | None = None,
+        page_size: int = 50,
+        max_workers: int = 8,
+    ) -> Generator[NoteListItem, None, None]:
+        """多线程并发翻页遍历仓库中所有笔记的生成器。
+
+        先请求第 1 页获取 total_rows，再用线程池并发请求其余页，按页码顺序产出结果。
+        并发数不超过连接池大小（pool_size）。
+
+        用法::
+
+            for note in client.iter_all_notes_threaded("my-vault", max_workers=8):
+                print(note.path)
+        """
+        params = _notes_params(vault, keyword, is_recycle, 1, page_size)
+        first = self._fetch_notes(params)
+        yield from first.list
+        # 服务端可能截断 page_size（最大 100），以实际返回值计算页数
+        size = first.pager.page_size or page_size
+        n_pages = math.ceil(first.pager.total_rows / size)
+        if n_pages <= 1:
+            return
+        params["page_size"] = size
+        ex = ThreadPoolExecutor(max_workers=min(max_workers, self.pool_size))
+        try:
+            futures = {
+                ex.submit(self._fetch_notes, {**params, "page": p}): p
+                for p in range(2, n_pages + 1)
+            }
+            done: dict[int, PaginatedResponse[NoteListItem]] = {}
+            next_page = 2
+            for fut in as_completed(futures):
+                done[futures[fut]] = fut.result()
+                while next_page in done:
+                    yield from done.pop(next_page).list
+                    next_page += 1
+        finally:
+            ex.shutdown(wait=False, cancel_futures=True)
+
     # ==================================================================
     # 需认证接口 — Note History
     # ==================================================================
@@ -425,18 +862,36 @@ class FastNoteClient:
             "page_size": page_size,
         }
         if is_recycle is not None:
-            params["isRecycle"] = str(is_recycle).lower()
+            params["isRecycle"] = _BOOL_STR[is_recycle]
         data = self._request("GET", "/note/histories", params=params)
-        items = [HistoryListItem.from_dict(h) for h in (data.get("list") or [])]
+        items = [HistoryListItem.from_dict_fast(h) for h in (data.get("list") or [])]
         pager = Pager.from_dict(data.get("pager", {}))
         return PaginatedResponse(list=items, pager=pager, raw=data)
 
     # 17. 获取历史详情
     def get_note_history(self, history_id: int) -> HistoryDetail:
         """GET /api/note/history — 获取某个历史版本的详细信息（含 diffs 和完整内容）。"""
-        data = self._request("GET", "/note/history", params={"id": history_id})
+        params = {"id": history_id}
+        data = self._request("GET", "/note/history", params=params)
         return HistoryDetail.from_dict(data)
 
+    # 17. 批量获取历史详情
+    def get_note_histories_bulk(
+        self,
+        history_ids: list[int],
+        *,
+        max_workers: int = 8,
+    ) -> list[HistoryDetail]:
+        """并发获取多个历史版本详情，返回顺序与 history_ids 一致。
+
+        并发数不超过连接池大小（pool_size）。
+        """
+        if not history_ids:
+            return []
+        workers = min(max_workers, self.pool_size, len(history_ids))
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            return list(ex.map(self.get_note_history, history_ids))
+
     # 18. 从历史版本恢复笔记
     def restore_note_from_history(
         self,
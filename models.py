@@ -1,43 +1,58 @@
 """Fast Note Sync Service — 响应模型
 
-使用标准库 dataclasses 定义，每个模型附带 raw 字段保留服务端原始 dict。
+使用标准库 dataclasses 定义，每个模型附带 raw 字段保留服务端原始 dict
+（NoteListItem / HistoryListItem / NoteInfo 默认不保留，见 set_keep_raw()；
+列表条目的原始数据可从 PaginatedResponse.raw 获取）。
 from_dict() 对未知字段容错：后端新增字段不会导致解析报错。
+每个模型的 _DEFAULTS 按字段声明顺序列出服务端字段名与默认值，
+字段齐全时一次 itemgetter 取出全部值，缺字段时才合并默认值。
 """
 
 from __future__ import annotations
 
+import operator
+import sys
 from dataclasses import dataclass, field
 from typing import Any, Generic, TypeVar
 
 T = TypeVar("T")
 
+# Python 3.10+ 使用 __slots__：实例无 __dict__，内存更小、属性访问更快
+_SLOTS: dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def _values(cls: Any, d: dict[str, Any]) -> tuple[Any, ...]:
+    """按 cls._DEFAULTS 从 d 中取出字段值（不含 raw）。"""
+    try:
+        return cls._GETTER(d)
+    except KeyError:
+        return cls._GETTER({**cls._DEFAULTS, **d})
+
 
 # ---------------------------------------------------------------------------
 # Pager
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(**_SLOTS)
 class Pager:
     page: int
     page_size: int
     total_rows: int
     raw: dict[str, Any] = field(default_factory=dict, repr=False)
 
+    _DEFAULTS = {"page": 1, "pageSize": 10, "totalRows": 0}
+    _GETTER = operator.itemgetter(*_DEFAULTS)
+
     @classmethod
     def from_dict(cls, d: dict[str, Any]) -> Pager:
-        return cls(
-            page=d.get("page", 1),
-            page_size=d.get("pageSize", 10),
-            total_rows=d.get("totalRows", 0),
-            raw=d,
-        )
+        return cls(*_values(cls, d), d)
 
 
 # ---------------------------------------------------------------------------
 # PaginatedResponse — 泛型分页包装
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(**_SLOTS)
 class PaginatedResponse(Generic[T]):
     list: list[T]
     pager: Pager
@@ -48,7 +63,7 @@ class PaginatedResponse(Generic[T]):
 # User
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(**_SLOTS)
 class UserInfo:
     uid: int
     email: str
@@ -59,67 +74,65 @@ class UserInfo:
     created_at: str
     raw: dict[str, Any] = field(default_factory=dict, repr=False)
 
+    _DEFAULTS = {
+        "uid": 0,
+        "email": "",
+        "username": "",
+        "token": "",
+        "avatar": "",
+        "updatedAt": "",
+        "createdAt": "",
+    }
+    _GETTER = operator.itemgetter(*_DEFAULTS)
+
     @classmethod
     def from_dict(cls, d: dict[str, Any]) -> UserInfo:
-        return cls(
-            uid=d.get("uid", 0),
-            email=d.get("email", ""),
-            username=d.get("username", ""),
-            token=d.get("token", ""),
-            avatar=d.get("avatar", ""),
-            updated_at=d.get("updatedAt", ""),
-            created_at=d.get("createdAt", ""),
-            raw=d,
-        )
+        return cls(*_values(cls, d), d)
 
 
 # ---------------------------------------------------------------------------
 # Version
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(**_SLOTS)
 class VersionInfo:
     version: str
     git_tag: str
     build_time: str
     raw: dict[str, Any] = field(default_factory=dict, repr=False)
 
+    _DEFAULTS = {"version": "", "gitTag": "", "buildTime": ""}
+    _GETTER = operator.itemgetter(*_DEFAULTS)
+
     @classmethod
     def from_dict(cls, d: dict[str, Any]) -> VersionInfo:
-        return cls(
-            version=d.get("version", ""),
-            git_tag=d.get("gitTag", ""),
-            build_time=d.get("buildTime", ""),
-            raw=d,
-        )
+        return cls(*_values(cls, d), d)
 
 
 # ---------------------------------------------------------------------------
 # WebGUI Config
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(**_SLOTS)
 class WebGUIConfig:
     font_set: str
     register_is_enable: bool
     admin_uid: int
     raw: dict[str, Any] = field(default_factory=dict, repr=False)
 
+    _DEFAULTS = {"fontSet": "", "registerIsEnable": False, "adminUid": 0}
+    _GETTER = operator.itemgetter(*_DEFAULTS)
+
     @classmethod
     def from_dict(cls, d: dict[str, Any]) -> WebGUIConfig:
-        return cls(
-            font_set=d.get("fontSet", ""),
-            register_is_enable=d.get("registerIsEnable", False),
-            admin_uid=d.get("adminUid", 0),
-            raw=d,
-        )
+        return cls(*_values(cls, d), d)
 
 
 # ---------------------------------------------------------------------------
 # Vault
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(**_SLOTS)
 class VaultInfo:
     id: int
     vault: str
@@ -130,25 +143,27 @@ class VaultInfo:
     size: int
     raw: dict[str, Any] = field(default_factory=dict, repr=False)
 
+    _DEFAULTS = {
+        "id": 0,
+        "vault": "",
+        "noteCount": 0,
+        "noteSize": 0,
+        "fileCount": 0,
+        "fileSize": 0,
+        "size": 0,
+    }
+    _GETTER = operator.itemgetter(*_DEFAULTS)
+
     @classmethod
     def from_dict(cls, d: dict[str, Any]) -> VaultInfo:
-        return cls(
-            id=d.get("id", 0),
-            vault=d.get("vault", ""),
-            note_count=d.get("noteCount", 0),
-            note_size=d.get("noteSize", 0),
-            file_count=d.get("fileCount", 0),
-            file_size=d.get("fileSize", 0),
-            size=d.get("size", 0),
-            raw=d,
-        )
+        return cls(*_values(cls, d), d)
 
 
 # ---------------------------------------------------------------------------
 # Note
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(**_SLOTS)
 class NoteListItem:
     """笔记列表中的条目（不含 content）"""
     id: int
@@ -163,24 +178,34 @@ class NoteListItem:
     created_at: str
     raw: dict[str, Any] = field(default_factory=dict, repr=False)
 
+    # 列表条目数量大，默认不保留每行原始 dict（整页数据见 PaginatedResponse.raw）
+    _KEEP_RAW = False
+
+    _DEFAULTS = {
+        "id": 0,
+        "action": "",
+        "path": "",
+        "pathHash": "",
+        "version": 0,
+        "ctime": 0,
+        "mtime": 0,
+        "updatedTimestamp": 0,
+        "updatedAt": "",
+        "createdAt": "",
+    }
+    _GETTER = operator.itemgetter(*_DEFAULTS)
+
+    @classmethod
+    def from_dict_fast(cls, d: dict[str, Any]) -> NoteListItem:
+        """from_dict 的批量快速路径（列表解析逐行调用）。"""
+        return cls(*_values(cls, d), d if cls._KEEP_RAW else {})
+
     @classmethod
     def from_dict(cls, d: dict[str, Any]) -> NoteListItem:
-        return cls(
-            id=d.get("id", 0),
-            action=d.get("action", ""),
-            path=d.get("path", ""),
-            path_hash=d.get("pathHash", ""),
-            version=d.get("version", 0),
-            ctime=d.get("ctime", 0),
-            mtime=d.get("mtime", 0),
-            updated_timestamp=d.get("updatedTimestamp", 0),
-            updated_at=d.get("updatedAt", ""),
-            created_at=d.get("createdAt", ""),
-            raw=d,
-        )
-
-
-@dataclass
+        return cls.from_dict_fast(d)
+
+
+@dataclass(**_SLOTS)
 class NoteDetail:
     """单条笔记完整内容"""
     id: int
@@ -197,26 +222,31 @@ class NoteDetail:
     created_at: str
     raw: dict[str, Any] = field(default_factory=dict, repr=False)
 
+    _DEFAULTS = {
+        "id": 0,
+        "path": "",
+        "pathHash": "",
+        "content": "",
+        "contentHash": "",
+        "fileLinks": {},
+        "version": 0,
+        "ctime": 0,
+        "mtime": 0,
+        "updatedTimestamp": 0,
+        "updatedAt": "",
+        "createdAt": "",
+    }
+    _GETTER = operator.itemgetter(*_DEFAULTS)
+
     @classmethod
     def from_dict(cls, d: dict[str, Any]) -> NoteDetail:
-        return cls(
-            id=d.get("id", 0),
-            path=d.get("path", ""),
-            path_hash=d.get("pathHash", ""),
-            content=d.get("content", ""),
-            content_hash=d.get("contentHash", ""),
-            file_links=d.get("fileLinks", {}),
-            version=d.get("version", 0),
-            ctime=d.get("ctime", 0),
-            mtime=d.get("mtime", 0),
-            updated_timestamp=d.get("updatedTimestamp", 0),
-            updated_at=d.get("updatedAt", ""),
-            created_at=d.get("createdAt", ""),
-            raw=d,
-        )
-
-
-@dataclass
+        note = cls(*_values(cls, d), d)
+        if "fileLinks" not in d:
+            note.file_links = {}  # 不与 _DEFAULTS 共享同一个可变 dict
+        return note
+
+
+@dataclass(**_SLOTS)
 class NoteInfo:
     """创建/更新/恢复笔记后的响应"""
     id: int
@@ -230,27 +260,32 @@ class NoteInfo:
     last_time: int
     raw: dict[str, Any] = field(default_factory=dict, repr=False)
 
+    # 创建/更新笔记的批量场景下同样默认不保留原始 dict
+    _KEEP_RAW = False
+
+    _DEFAULTS = {
+        "id": 0,
+        "path": "",
+        "pathHash": "",
+        "content": "",
+        "contentHash": "",
+        "version": 0,
+        "ctime": 0,
+        "mtime": 0,
+        "lastTime": 0,
+    }
+    _GETTER = operator.itemgetter(*_DEFAULTS)
+
     @classmethod
     def from_dict(cls, d: dict[str, Any]) -> NoteInfo:
-        return cls(
-            id=d.get("id", 0),
-            path=d.get("path", ""),
-            path_hash=d.get("pathHash", ""),
-            content=d.get("content", ""),
-            content_hash=d.get("contentHash", ""),
-            version=d.get("version", 0),
-            ctime=d.get("ctime", 0),
-            mtime=d.get("mtime", 0),
-            last_time=d.get("lastTime", 0),
-            raw=d,
-        )
+        return cls(*_values(cls, d), d if cls._KEEP_RAW else {})
 
 
 # ---------------------------------------------------------------------------
 # Note History
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(**_SLOTS)
 class HistoryListItem:
     """历史列表条目"""
     id: int
@@ -262,35 +297,45 @@ class HistoryListItem:
     created_at: str
     raw: dict[str, Any] = field(default_factory=dict, repr=False)
 
+    # 列表条目数量大，默认不保留每行原始 dict（整页数据见 PaginatedResponse.raw）
+    _KEEP_RAW = False
+
+    _DEFAULTS = {
+        "id": 0,
+        "noteId": 0,
+        "vaultId": 0,
+        "path": "",
+        "clientName": "",
+        "version": 0,
+        "createdAt": "",
+    }
+    _GETTER = operator.itemgetter(*_DEFAULTS)
+
+    @classmethod
+    def from_dict_fast(cls, d: dict[str, Any]) -> HistoryListItem:
+        """from_dict 的批量快速路径（列表解析逐行调用）。"""
+        return cls(*_values(cls, d), d if cls._KEEP_RAW else {})
+
     @classmethod
     def from_dict(cls, d: dict[str, Any]) -> HistoryListItem:
-        return cls(
-            id=d.get("id", 0),
-            note_id=d.get("noteId", 0),
-            vault_id=d.get("vaultId", 0),
-            path=d.get("path", ""),
-            client_name=d.get("clientName", ""),
-            version=d.get("version", 0),
-            created_at=d.get("createdAt", ""),
-            raw=d,
-        )
-
-
-@dataclass
+        return cls.from_dict_fast(d)
+
+
+@dataclass(**_SLOTS)
 class DiffItem:
     """Diff 结果中的单个条目"""
     type: int       # -1=删除, 0=相等, 1=插入
     text: str
 
+    _DEFAULTS = {"Type": 0, "Text": ""}
+    _GETTER = operator.itemgetter(*_DEFAULTS)
+
     @classmethod
     def from_dict(cls, d: dict[str, Any]) -> DiffItem:
-        return cls(
-            type=d.get("Type", 0),
-            text=d.get("Text", ""),
-        )
+        return cls(*_values(cls, d))
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class HistoryDetail:
     """历史详情（含 diffs 和完整内容）"""
     id: int
@@ -305,28 +350,37 @@ class HistoryDetail:
     created_at: str
     raw: dict[str, Any] = field(default_factory=dict, repr=False)
 
+    # diffs 单独解析，不在字段表中
+    _DEFAULTS = {
+        "id": 0,
+        "noteId": 0,
+        "vaultId": 0,
+        "path": "",
+        "content": "",
+        "contentHash": "",
+        "clientName": "",
+        "version": 0,
+        "createdAt": "",
+    }
+    _GETTER = operator.itemgetter(*_DEFAULTS)
+
     @classmethod
     def from_dict(cls, d: dict[str, Any]) -> HistoryDetail:
-        return cls(
-            id=d.get("id", 0),
-            note_id=d.get("noteId", 0),
-            vault_id=d.get("vaultId", 0),
-            path=d.get("path", ""),
-            diffs=[DiffItem.from_dict(x) for x in d.get("diffs", [])],
-            content=d.get("content", ""),
-            content_hash=d.get("contentHash", ""),
-            client_name=d.get("clientName", ""),
-            version=d.get("version", 0),
-            created_at=d.get("createdAt", ""),
-            raw=d,
-        )
+        item = DiffItem
+        get = item._GETTER
+        try:
+            diffs = [item(*get(x)) for x in d["diffs"]]
+        except KeyError:
+            diffs = [item.from_dict(x) for x in d.get("diffs", [])]
+        vals = _values(cls, d)
+        return cls(*vals[:4], diffs, *vals[4:], d)
 
 
 # ---------------------------------------------------------------------------
 # Admin Config
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(**_SLOTS)
 class AdminConfig:
     font_set: str
     register_is_enable: bool
@@ -337,15 +391,36 @@ class AdminConfig:
     admin_uid: int
     raw: dict[str, Any] = field(default_factory=dict, repr=False)
 
+    _DEFAULTS = {
+        "fontSet": "",
+        "registerIsEnable": False,
+        "fileChunkSize": "",
+        "softDeleteRetentionTime": "",
+        "uploadSessionTimeout": "",
+        "historyKeepVersions": 0,
+        "adminUid": 0,
+    }
+    _GETTER = operator.itemgetter(*_DEFAULTS)
+
     @classmethod
     def from_dict(cls, d: dict[str, Any]) -> AdminConfig:
-        return cls(
-            font_set=d.get("fontSet", ""),
-            register_is_enable=d.get("registerIsEnable", False),
-            file_chunk_size=d.get("fileChunkSize", ""),
-            soft_delete_retention_time=d.get("softDeleteRetentionTime", ""),
-            upload_session_timeout=d.get("uploadSessionTimeout", ""),
-            history_keep_versions=d.get("historyKeepVersions", 0),
-            admin_uid=d.get("adminUid", 0),
-            raw=d,
-        )
+        return cls(*_values(cls, d), d)
+
+
+# ---------------------------------------------------------------------------
+# raw 保留开关
+# ---------------------------------------------------------------------------
+
+# 默认不保留 raw 的模型（数量多或体积大）
+_RAW_OPTIONAL = (NoteListItem, HistoryListItem, NoteInfo)
+
+
+def set_keep_raw(keep: bool = True) -> None:
+    """全局开关：让 NoteListItem / HistoryListItem / NoteInfo 也保留原始 dict。
+
+    默认关闭以便解析后尽快释放每行的原始数据，调试时可打开::
+
+        pyclient.set_keep_raw(True)
+    """
+    for model in _RAW_OPTIONAL:
+        model._KEEP_RAW = keep